@@ -1,27 +1,14 @@
 from __future__ import annotations  # allows us to use class name as type w/in that class
 from enum import Enum
-import copy
-import random
 
 ###############################################################################
-# for installing termcolor if it doesn't exist already
+# termcolor is optional -- without it, the board is simply drawn uncolored
 #
-import sys
-import subprocess
-import pkg_resources
-import os
-
-required = {'termcolor'}
-installed = {pkg.key for pkg in pkg_resources.working_set}
-missing = required - installed
-
-if missing:
-    print(f"Installing Python libraries {', '.join(missing)}")
-    python = sys.executable
-    # subprocess.check_call([python, '-m', 'pip', 'install', *missing], stdout=subprocess.DEVNULL)
-    subprocess.check_call([python, '-m', 'pip', 'install', *missing])  # will show install output
-
-from termcolor import colored
+try:
+    from termcolor import colored
+except ImportError:
+    def colored(text: str, color: str) -> str:
+        return text
 
 ######################################################################
 class Player(Enum):
@@ -32,32 +19,94 @@ class Player(Enum):
     def __str__(self) -> str: 
         return self.value # .value from Enum
 
+# opposite of each player, looked up rather than branched on
+_OPPOSITE = {Player.X: Player.O, Player.O: Player.X}
+
 ######################################################################
-class Square:
-    __slots__ = ('_player')
+# bit masks for each of the eight winning lines (horizontal, vertical,
+# diagonal); bit i of a mask corresponds to square i of the board
+WIN_MASKS = (0b000000111, 0b000111000, 0b111000000, \
+             0b001001001, 0b010010010, 0b100100100, \
+             0b100010001, 0b001010100)
+
+# order in which legal moves are offered: center, then corners, then edges --
+# trying the strongest squares first lets alpha-beta pruning cut off sooner
+MOVE_PRIORITY = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+# bitboard with all nine squares occupied
+FULL_MASK = 0b111111111
+
+# for each square, the winning lines passing through it -- after a move only
+# these lines can have been completed (2 for an edge, 3 for a corner, 4 for
+# the center, vs. all 8 of WIN_MASKS)
+LINES_THROUGH = tuple(tuple(win for win in WIN_MASKS if win & (1 << square))
+                      for square in range(9))
+
+# the legal moves (in MOVE_PRIORITY order) for each of the 512 possible
+# occupied-squares bitboards, so getLegalMoves is a single table lookup
+_LEGAL_MOVES = tuple(tuple(s for s in MOVE_PRIORITY if not (occupied >> s) & 1)
+                     for occupied in range(FULL_MASK + 1))
 
-    def __init__(self) -> None:
-        self._player: Player = Player.NONE
+def hasWinningLine(mask: int) -> bool:
+    ''' check whether a single player's bitboard holds a winning line
+    Parameters:
+        mask: bitboard of the squares held by one player
+    Returns:
+        True if mask covers any of WIN_MASKS; False o/w
+    '''
+    for win in WIN_MASKS:
+        if (mask & win) == win:
+            return True
+    return False
 
-    def getPlayer(self) -> Player:
-        return self._player
+def _findWinner(x: int, o: int) -> Player:
+    ''' scan all of WIN_MASKS for a player holding a complete line
+    Returns:
+        Player.X or Player.O if that player has won; o/w Player.NONE
+    '''
+    if hasWinningLine(x): return Player.X
+    if hasWinningLine(o): return Player.O
+    return Player.NONE
 
-    def setPlayer(self, player: Player) -> None:
-        self._player = player
+def _completesLine(mask: int, square: int) -> bool:
+    ''' check whether a player's bitboard holds a complete line through the
+        given square -- after a move, only these lines can have changed
+    '''
+    for win in LINES_THROUGH[square]:
+        if (mask & win) == win:
+            return True
+    return False
 
 ######################################################################
 class Board:
-    __slots__ = ('_board','_current_player')
+    __slots__ = ('_x','_o','_current_player','_winner')
 
-    def __init__(self, board: list[Square] = [Square() for i in range(9)], 
+    def __init__(self, x: int = 0, o: int = 0,
                        current_player: Player = Player.X) -> None:
         ''' initializer for a TicTacToe board
         Parameters:
-            board: a list of Square objects (default is all empty)
+            x: bitboard of the squares held by X, bit i <-> square i (default empty)
+            o: bitboard of the squares held by O, bit i <-> square i (default empty)
             current_player: the player to make the next move (default is X)
         '''
-        self._board          : list[Square] = board
-        self._current_player : Player       = current_player
+        self._x              : int    = x
+        self._o              : int    = o
+        self._current_player : Player = current_player
+        self._winner         : Player = _findWinner(x, o)
+
+    @classmethod
+    def _make(cls, x: int, o: int, current_player: Player,
+                   winner: Player) -> Board:
+        ''' build a Board whose winner is already known, skipping the scan
+            in __init__ -- only for getNewBoardWithMove, which derives the
+            winner from the previous board and the move just made
+        '''
+        board = cls.__new__(cls)
+        board._x              = x
+        board._o              = o
+        board._current_player = current_player
+        board._winner         = winner
+        return board
 
     def __str__(self) -> str:
         ''' draws the Board object in traditional Tic-Tac-Toe 3x3 form 
@@ -65,17 +114,36 @@ class Board:
             a string representation of the Board
         '''
         board_str = "\n"
-        for s in range(len(self._board)):
-            if self._board[s].getPlayer() == Player.NONE:
+        for s in range(9):
+            if (self._x >> s) & 1:
+                occupant = colored(str(Player.X), "red")
+                board_str += f" {occupant} " # display the occupant
+            elif (self._o >> s) & 1:
+                occupant = colored(str(Player.O), "red")
+                board_str += f" {occupant} " # display the occupant
+            else:
                 pos_num = colored(str(s), "blue")
                 board_str += f" {pos_num} "  # display the valid position number
-            else:
-                occupant = colored(str(self._board[s].getPlayer()), "red")
-                board_str += f" {occupant} " # display the occupant
             if s % 3 < 2: board_str += '|'
             if s == 2 or s == 5: board_str += '\n' + str('-' * 11) + '\n'
         return board_str + "\n"
 
+    def __eq__(self, other: object) -> bool:
+        ''' two Boards are equal if they hold the same squares for each player
+            and have the same player to move
+        '''
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self._x == other._x and self._o == other._o and \
+               self._current_player is other._current_player
+
+    def __hash__(self) -> int:
+        ''' hash matching __eq__, so Boards can be used as dict/set keys --
+            whose turn it is enters as a bool, the same form as the search
+            tables' keys, since hashing a Player member is much slower
+        '''
+        return hash((self._x, self._o, self._current_player is Player.X))
+
     @property
     def oppositePlayer(self) -> Player:
         ''' property (can treat as a variable rather than function call) to
@@ -83,9 +151,7 @@ class Board:
         Returns:
             Player.X if current player is O; o/w Player.O
         '''
-        if self._current_player is Player.X: return Player.O
-        if self._current_player is Player.O: return Player.X
-        return Player.NONE
+        return _OPPOSITE.get(self._current_player, Player.NONE)
 
     def getCurrentPlayer(self) -> Player:
         ''' who has the current turn
@@ -97,57 +163,57 @@ class Board:
     def getLegalMoves(self) -> list[int]:
         ''' returns a list of the still-valid moves to make
         Returns:
-            a list of integers corresponding to valid moves
+            a list of integers corresponding to valid moves, in MOVE_PRIORITY
+            order
         '''
-        moves = [s for s in range(len(self._board)) \
-                    if self._board[s].getPlayer() == Player.NONE]
-        return random.sample(moves, len(moves)) # so not always biasing early squares
+        return list(_LEGAL_MOVES[self._x | self._o])
 
     def getNewBoardWithMove(self, square: int) -> Board:
         ''' create a new copy of the Board with a given move by
             the current player
         Parameters:
-            square: integer in [0,8] corresponding to desired Square
+            square: integer in [0,8] corresponding to desired square
         Returns:
             a new Board with the current player taking the given square
         '''
-        if square not in self.getLegalMoves():
+        if not 0 <= square <= 8 or ((self._x | self._o) >> square) & 1:
             raise ValueError(f"Invalid move to square {square}")
-        # create a copy of the board
-        board_copy = copy.deepcopy(self._board)
-        # current player takes indicated square
-        board_copy[square].setPlayer(self._current_player)
-        # return a new board updated with the current move, and swap
-        # to indicate opposite player as the current player
-        return Board(board = board_copy, \
-                     current_player = self.oppositePlayer)
+        # current player takes indicated square; return a new board updated
+        # with the current move, and swap to indicate opposite player as the
+        # current player -- the new board can only have a (new) winner if
+        # this move completed one of the lines through the square
+        mask   = 1 << square
+        winner = self._winner
+        if self._current_player is Player.X:
+            x = self._x | mask
+            if winner is Player.NONE and _completesLine(x, square):
+                winner = Player.X
+            return Board._make(x, self._o, Player.O, winner)
+        o = self._o | mask
+        if winner is Player.NONE and _completesLine(o, square):
+            winner = Player.O
+        return Board._make(self._x, o, Player.X, winner)
+
+    def getWinner(self) -> Player:
+        ''' determine which player, if any, holds a complete winning line
+        Returns:
+            Player.X or Player.O if that player has won; o/w Player.NONE
+        '''
+        return self._winner
 
     def isWin(self) -> bool:
         ''' check whether the state of this Board is a win
         Returns:
-            a tuple with:
-                (True, winner) if either of X or O is in a winning state;
-                (False, None)
+            True if either of X or O is in a winning state; False o/w
         '''
-        # list of possible wins in horizontal, vertical, diagonal
-        wins = [(0,1,2), (3,4,5), (6,7,8), \
-                (0,3,6), (1,4,7), (2,5,8), \
-                (0,4,8), (2,4,6)]
-        board = self._board # just for brevity below
-        for win in wins:
-            # check if the squares @ ordered triple locations match and aren't empty
-            if board[win[0]].getPlayer() == \
-               board[win[1]].getPlayer() == \
-               board[win[2]].getPlayer() != Player.NONE:
-                return True
-        return False
+        return self._winner is not Player.NONE
 
     def isDraw(self) -> bool:
         ''' check whether the state of this Board is a draw
         Returns:
             True if the current board state is a draw; False o/w
         '''
-        return not self.isWin() and len(self.getLegalMoves()) == 0
+        return (self._x | self._o) == FULL_MASK and self._winner is Player.NONE
 
     def evaluate(self, original_player: Player) -> int:
         ''' evaluates the current board state, returning 0 on a draw, 1 on a
@@ -166,12 +232,29 @@ class Board:
         #       to try the next move) is the other player
         #   - a loss for the original player if the current player is the
         #       original player
-        if self.isWin() and self._current_player == original_player:
+        if self._winner is Player.NONE:
+            return 0
+        elif self._current_player is original_player:
             return -1   # original player loses (other won on prev move)
-        elif self.isWin() and self._current_player != original_player:
-            return 1    # original player wins (on prev move)
         else:
+            return 1    # original player wins (on prev move)
+
+    def status(self, original_player: Player) -> int | None:
+        ''' combined terminal test and evaluation
+            (equivalent to evaluate() when isWin() or isDraw(), else None)
+        Parameters:
+            original_player: the original player kicking off this decision-tree
+                exploration to determine what that player should do
+        Returns:
+            1 on a win for the original player, -1 on a loss, 0 on a draw,
+            or None if the game is still ongoing
+        '''
+        if self._winner is not Player.NONE:
+            # the winner moved last, so see evaluate() for the sign
+            return -1 if self._current_player is original_player else 1
+        if (self._x | self._o) == FULL_MASK:
             return 0
+        return None
 
 ######################################################################
 def main():
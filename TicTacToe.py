@@ -1,66 +1,243 @@
 from Board import *
-import copy
+import multiprocessing
+
+# transposition table:
+#   (x bitboard, o bitboard, x_to_move, is_maximizing) -> (score, bound)
+# -- whose turn it is together with is_maximizing fixes the original player,
+# so entries stay valid for the whole game; the key is kept to plain ints and
+# bools, which hash far faster than Player members
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+_TT: dict[tuple[int, int, bool, bool], tuple[int, int]] = {}
+
+class _Frame:
+    ''' one partially explored node on minimax's explicit stack '''
+    __slots__ = ('board', 'is_maximizing', 'key', 'alpha', 'beta', 'window',
+                 'best', 'moves', 'next_move')
+
+    def __init__(self, board: Board, is_maximizing: bool, key: tuple,
+                       alpha: float, beta: float) -> None:
+        self.board         : Board     = board
+        self.is_maximizing : bool      = is_maximizing
+        self.key           : tuple     = key
+        self.alpha         : float     = alpha
+        self.beta          : float     = beta
+        self.window        : tuple     = (alpha, beta)  # as originally searched
+        self.best          : float     = float("-inf") if is_maximizing \
+                                         else float("inf")
+        self.moves         : list[int] = board.getLegalMoves()
+        self.next_move     : int       = 0  # index into moves
 
 def minimax(current_board:   Board, \
             is_maximizing:   bool, \
             original_player: Player, \
-            debug:           bool = False) -> int:
-    if current_board.isWin() or current_board.isDraw():
-        return current_board.evaluate(original_player)
-
-    if is_maximizing:
-        best_result = float("-inf")
-        for move in current_board.getLegalMoves():
-            is_maximizing = False
-            result = minimax(current_board.getNewBoardWithMove(move),
-							is_maximizing, original_player)
-                            #update best_result if appropriate
-            if result > best_result:
-                best_result = result
-        return best_result
-    else:
-        worst_result = float("inf")
-        for move in current_board.getLegalMoves():
-            is_maximizing = True
-            result = minimax(current_board.getNewBoardWithMove(move),
-                            is_maximizing, original_player)
-            #update worst_result if appropriate
+            debug:           bool  = False, \
+            alpha:           float = float("-inf"), \
+            beta:            float = float("inf")) -> int:
+    ''' minimax with alpha-beta pruning -- alpha is the best score the
+        maximizer is already assured of, beta the best score the minimizer
+        is already assured of; once alpha >= beta, the remaining moves of the
+        current node cannot change the outcome higher up, so they are skipped
 
-            if result < worst_result:
-                worst_result = result
-        return worst_result
+        scores are memoized in _TT; since a pruned search only bounds the
+        true score, each entry records whether it is exact or a lower/upper
+        bound
 
+        the tree is walked with an explicit stack of _Frame objects rather
+        than by recursion, avoiding a Python call per node
+    '''
+    stack: list[_Frame] = []
+    board = current_board
+    while True:
+        # entering a node: settle it right away if terminal or already known
+        score = board.status(original_player)
+        if score is None:
+            key = (board._x, board._o, board._current_player is Player.X,
+                   is_maximizing)
+            entry = _TT.get(key)
+            if entry is not None:
+                tt_score, bound = entry
+                if bound == _EXACT:
+                    score = tt_score
+                else:
+                    if bound == _LOWER:
+                        alpha = max(alpha, tt_score)
+                    else:
+                        beta = min(beta, tt_score)
+                    if beta <= alpha:
+                        score = tt_score
+        if score is None:
+            # descend into the first move of this node
+            frame = _Frame(board, is_maximizing, key, alpha, beta)
+            stack.append(frame)
+            frame.next_move = 1
+            board = board.getNewBoardWithMove(frame.moves[0])
+            is_maximizing = not is_maximizing
+            continue
 
-def findBestMove(current_board: Board, debug: bool = False) -> int:
-    ''' Function for the computer to find its best possible move among all
-        remaining moves.  This is accomplished by calling the recursive
-        minimax, which will alternate player turns who are alternating
-        minimizing and maximizing (i.e., O is trying to minimize X's outcome,
-        while X is trying to maximize X's outcome).
+        # returning a score: hand it up until some node has a move left to try
+        while stack:
+            frame = stack[-1]
+            if frame.is_maximizing:
+                #update best_result if appropriate
+                frame.best  = max(frame.best, score)
+                frame.alpha = max(frame.alpha, frame.best)
+            else:
+                #update worst_result if appropriate
+                frame.best  = min(frame.best, score)
+                frame.beta  = min(frame.beta, frame.best)
+            # beta <= alpha: the opponent above will never allow this branch
+            if frame.beta > frame.alpha and frame.next_move < len(frame.moves):
+                move = frame.moves[frame.next_move]
+                frame.next_move += 1
+                board = frame.board.getNewBoardWithMove(move)
+                is_maximizing = not frame.is_maximizing
+                alpha, beta = frame.alpha, frame.beta
+                break
+            # node finished -- a score at or outside the searched window is
+            # only a bound
+            stack.pop()
+            score = frame.best
+            if score <= frame.window[0]:
+                _TT[frame.key] = (score, _UPPER)
+            elif score >= frame.window[1]:
+                _TT[frame.key] = (score, _LOWER)
+            else:
+                _TT[frame.key] = (score, _EXACT)
+        else:
+            return score
+
+
+def scoreMove(next_board:      Board, \
+              original_player: Player, \
+              debug:           bool  = False, \
+              alpha:           float = float("-inf"), \
+              use_numba:       bool  = False) -> int:
+    ''' evaluate one root move for the original player, i.e., the outcome
+        when the other player (the minimizer) takes over after that move
+    Parameters:
+        next_board: the Board after the original player makes the move
+        original_player: the player whose root move is being evaluated
+        debug: boolean -- if True, prints debugging info
+        alpha: the best score already assured by an earlier root move
+        use_numba: boolean -- if True, searches with minimax_core's compiled
+            kernel instead of minimax (see minimax_core for when that helps)
+    Returns:
+        1 if the move leads to a win, -1 to a loss, and 0 to a draw (or, when
+        that can't beat alpha, some score <= alpha)
+    '''
+    is_maximizing = False  # O will attempt to minimize X's outcome
+    if use_numba:
+        # imported only on request, since loading numba is itself slow
+        import minimax_core
+        return minimax_core.minimax(next_board._x, next_board._o, \
+                   next_board.getCurrentPlayer() is Player.X, is_maximizing, \
+                   max(alpha, minimax_core.ALPHA_MIN), minimax_core.BETA_MAX)
+    return minimax(next_board, is_maximizing, original_player, \
+                   debug, alpha, float("inf"))
+
+def _scoreRootMove(task: tuple[int, int, Player, Player, bool]) -> int:
+    ''' multiprocessing worker for findBestMove -- takes the board after a
+        root move as plain bitboards (cheap to pickle) and scores that move
+    '''
+    x, o, current_player, original_player, use_numba = task
+    return scoreMove(Board(x, o, current_player), original_player, \
+                     use_numba=use_numba)
+
+# with a single root move there is nothing to split between workers; above
+# that, parallel=True always starts a pool, even though it never pays off
+# here (see searchBestMove)
+MIN_PARALLEL_MOVES = 2
+
+def searchBestMove(current_board: Board, debug: bool = False, \
+                   parallel: bool = False, \
+                   processes: int | None = None, \
+                   use_numba: bool = False) -> tuple[int, int]:
+    ''' search for the current player's best move by calling minimax, which
+        will alternate player turns who are alternating minimizing and
+        maximizing (i.e., O is trying to minimize X's outcome, while X is
+        trying to maximize X's outcome)
     Parameters:
         current_board: a Board object, the current board state
         debug: boolean -- if True, prints debugging info
+        parallel: boolean -- if True, scores the root moves in a process pool
+            (same result as the sequential search); for Tic-Tac-Toe this
+            never pays off -- searching even an empty board takes only ~10 ms
+            sequentially, while starting the pool alone costs ~35-65 ms with
+            fork and ~100-170 ms with spawn/forkserver, and each worker
+            also loses the pruning and _TT entries shared between siblings
+        processes: number of worker processes (default is one per CPU)
+        use_numba: boolean -- if True, scores the root moves with
+            minimax_core's compiled kernel (opt-in; see minimax_core)
     Returns:
-        the evaluation of the best move for the computer (1 if leading to a
-            win, -1 if leading to a loss, 0 if leading to a draw)
+        a tuple with the best move and its evaluation for the current player
+            (1 if leading to a win, -1 if leading to a loss, 0 if leading to
+            a draw)
     '''
+    moves = current_board.getLegalMoves()
+    original_player = current_board.getCurrentPlayer()
+    if parallel and len(moves) >= MIN_PARALLEL_MOVES:
+        # root moves are independent, so score them in separate processes;
+        # each subtree is searched with a full window, since alpha from
+        # sibling moves can't be shared across processes
+        if debug: print(f"{original_player} exploring {moves} in parallel")
+        tasks = []
+        for move in moves:
+            next_board = current_board.getNewBoardWithMove(move)
+            tasks.append((next_board._x, next_board._o, \
+                          next_board.getCurrentPlayer(), original_player, \
+                          use_numba))
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(_scoreRootMove, tasks)
+    else:
+        results = None
+
     best_result = float("-inf")
     best_move   = None
-    for move in current_board.getLegalMoves():
-        is_maximizing = False  # O will attempt to minimize X's outcome
-        if debug: print(f"{current_board.getCurrentPlayer()} exploring {move}")
-        # determine the eventual outcome when O tries the current move,
-        # by exploring all possible outcomes along the decision tree when
-        # O tries that move
-        result = minimax(current_board.getNewBoardWithMove(move), \
-                         is_maximizing, \
-                         current_board.getCurrentPlayer(), \
-                         debug)
+    alpha       = float("-inf")
+    for i, move in enumerate(moves):
+        if results is not None:
+            result = results[i]
+        else:
+            if debug: print(f"{original_player} exploring {move}")
+            # determine the eventual outcome when O tries the current move,
+            # by exploring all possible outcomes along the decision tree when
+            # O tries that move
+            result = scoreMove(current_board.getNewBoardWithMove(move), \
+                               original_player, debug, alpha, use_numba)
         # keep track of best outcome that can occur across all possible moves
         if result > best_result:
             best_result = result
             best_move = move
-    return best_move
+        # later root moves only matter if they can beat the best so far
+        alpha = max(alpha, best_result)
+    return best_move, best_result
+
+def findBestMove(current_board: Board, debug: bool = False, \
+                 parallel: bool = False, processes: int | None = None) -> int:
+    ''' Function for the computer to find its best possible move among all
+        remaining moves.  This is looked up in the precomputed policy or,
+        failing that, found by searchBestMove.
+    Parameters:
+        current_board: a Board object, the current board state
+        debug: boolean -- if True, prints debugging info
+        parallel: boolean -- if True, a search (only needed for boards that
+            aren't precomputed) scores the root moves in a process pool
+        processes: number of worker processes (default is one per CPU)
+    Returns:
+        the best move for the computer, an integer in [0,8]
+    '''
+    # precompute solves every position reachable in play when first imported;
+    # importing it here rather than at the top keeps that solve out of
+    # searchBestMove's worker processes, which re-import this module under
+    # the spawn/forkserver start methods but never need the table
+    from precompute import BEST_MOVE
+    # only hand-built boards fall through to a search
+    entry = BEST_MOVE.get((current_board._x, current_board._o, \
+                           current_board.getCurrentPlayer() is Player.X))
+    if entry is not None:
+        if debug: print(f"{current_board.getCurrentPlayer()} looked up {entry[0]}")
+        return entry[0]
+    return searchBestMove(current_board, debug, parallel, processes)[0]
 
 def getPlayerMove(board: Board) -> int:
     ''' ask the user for a valid board space, returning that integer
@@ -0,0 +1,55 @@
+''' the complete Tic-Tac-Toe policy, solved once at import time
+
+    Tic-Tac-Toe has only a few thousand reachable positions, so rather than
+    searching on every computer turn, every position reachable from an empty
+    board is solved up front and findBestMove becomes a dictionary lookup
+'''
+from Board import MOVE_PRIORITY, FULL_MASK, hasWinningLine
+
+# (x bitboard, o bitboard, x_to_move) -> (best move, score for the mover)
+# for every non-terminal position reachable from an empty board
+BEST_MOVE: dict[tuple[int, int, bool], tuple[int, int]] = {}
+
+def _solve(x: int, o: int, x_to_move: bool) -> int:
+    ''' negamax over bitboards, memoized in BEST_MOVE -- one full-window
+        visit per position, so every stored score is exact
+    Parameters:
+        x: bitboard of the squares held by X
+        o: bitboard of the squares held by O
+        x_to_move: True if X makes the next move; False if O does
+    Returns:
+        1 if the player to move wins with best play, -1 if they lose, and 0
+        if a draw
+    '''
+    # only the player who just moved can have completed a line
+    if hasWinningLine(o if x_to_move else x):
+        return -1
+    occupied = x | o
+    if occupied == FULL_MASK:
+        return 0
+    key = (x, o, x_to_move)
+    entry = BEST_MOVE.get(key)
+    if entry is not None:
+        return entry[1]
+
+    best_result = -2
+    best_move   = None
+    for square in MOVE_PRIORITY:
+        if (occupied >> square) & 1:
+            continue
+        if x_to_move:
+            result = -_solve(x | (1 << square), o, False)
+        else:
+            result = -_solve(x, o | (1 << square), True)
+        # strictly better only, so ties go to the earliest move in
+        # MOVE_PRIORITY -- the same move TicTacToe.searchBestMove picks
+        if result > best_result:
+            best_result = result
+            best_move   = square
+    BEST_MOVE[key] = (best_move, best_result)
+    return best_result
+
+# X normally moves first, but a Board may also be started with O to move,
+# so both game trees are solved
+_solve(0, 0, True)
+_solve(0, 0, False)
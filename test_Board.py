@@ -0,0 +1,89 @@
+''' unit checks for the Board class '''
+import pytest
+
+from Board import Board, Player, MOVE_PRIORITY, FULL_MASK, LINES_THROUGH, \
+                  _LEGAL_MOVES
+
+######################################################################
+def test_getLegalMoves_follows_MOVE_PRIORITY():
+    assert Board().getLegalMoves() == list(MOVE_PRIORITY)
+
+def test_getLegalMoves_skips_occupied_squares_in_priority_order():
+    board = Board().getNewBoardWithMove(4).getNewBoardWithMove(0)
+    assert board.getLegalMoves() == [2, 6, 8, 1, 3, 5, 7]
+
+def test_legal_move_table_matches_a_direct_scan():
+    for occupied in range(FULL_MASK + 1):
+        assert _LEGAL_MOVES[occupied] == \
+            tuple(s for s in MOVE_PRIORITY if not (occupied >> s) & 1)
+
+def test_getNewBoardWithMove_rejects_occupied_square():
+    board = Board().getNewBoardWithMove(4)
+    with pytest.raises(ValueError):
+        board.getNewBoardWithMove(4)
+
+@pytest.mark.parametrize("square", [-1, 9])
+def test_getNewBoardWithMove_rejects_out_of_range_square(square):
+    with pytest.raises(ValueError):
+        Board().getNewBoardWithMove(square)
+
+def test_isDraw_on_full_board_without_winner():
+    # X O X / X O O / O X X
+    board = Board(0b110001101, 0b001110010, Player.O)
+    assert board.isDraw()
+    assert not board.isWin()
+
+def test_isDraw_false_on_full_board_with_winner():
+    # X X X / O O X / X O O -- the last move filled the board and won
+    board = Board(0b001100111, 0b110011000, Player.O)
+    assert board.isWin()
+    assert not board.isDraw()
+
+def test_status_on_full_board_without_winner_is_draw():
+    board = Board(0b110001101, 0b001110010, Player.O)
+    assert board.status(Player.X) == 0
+    assert board.status(Player.O) == 0
+
+def test_status_scores_win_for_player_who_moved_last():
+    board = Board(0b001100111, 0b110011000, Player.O)  # X just won
+    assert board.status(Player.X) == 1
+    assert board.status(Player.O) == -1
+
+def test_status_of_ongoing_game_is_None():
+    assert Board().getNewBoardWithMove(4).status(Player.X) is None
+
+def test_LINES_THROUGH_lists_each_line_containing_the_square():
+    assert [len(lines) for lines in LINES_THROUGH] == [3, 2, 3, 2, 4, 2, 3, 2, 3]
+    for square, lines in enumerate(LINES_THROUGH):
+        assert all(win & (1 << square) for win in lines)
+
+def test_boards_with_same_squares_and_player_to_move_are_equal():
+    board = Board().getNewBoardWithMove(4).getNewBoardWithMove(0)
+    assert board == Board(0b000010000, 0b000000001, Player.X)
+    assert hash(board) == hash(Board(0b000010000, 0b000000001, Player.X))
+
+def test_boards_differing_in_player_to_move_are_not_equal():
+    assert Board(0b10000, 0b1, Player.X) != Board(0b10000, 0b1, Player.O)
+
+def test_equal_boards_share_a_dict_key():
+    scores = {Board().getNewBoardWithMove(4): 0}
+    assert scores[Board(0b10000, 0, Player.O)] == 0
+
+def test_comparison_with_non_Board_is_NotImplemented():
+    assert Board().__eq__("board") is NotImplemented
+    assert Board() != "board"
+
+def test_constructor_always_scans_for_a_winner():
+    assert Board(0b000000111, 0b000011000, Player.O).isWin()
+    assert Board(0b000000111, 0b000011000, Player.O).getWinner() is Player.X
+
+def test_move_completing_a_line_sets_the_winner():
+    board = Board(0b000000011, 0b000011000, Player.X).getNewBoardWithMove(2)
+    assert board.getWinner() is Player.X
+    assert board.status(Player.X) == 1
+
+def test_winner_is_carried_forward_after_the_game_ends():
+    board = Board(0b000000111, 0b000011000, Player.O).getNewBoardWithMove(5)
+    # O's move completes 3-4-5, but X had already won
+    assert board.getWinner() is Player.X
+    assert board.isWin() and not board.isDraw()
@@ -0,0 +1,94 @@
+''' regression checks: findBestMove must pick an optimal move in every
+    reachable position, for games started by either X or O
+'''
+from functools import lru_cache
+
+import pytest
+
+from Board import Board, Player
+import TicTacToe
+from precompute import BEST_MOVE
+
+######################################################################
+def _lines(mask: int) -> bool:
+    ''' independent win test on a single player's bitboard '''
+    wins = [(0,1,2), (3,4,5), (6,7,8), \
+            (0,3,6), (1,4,7), (2,5,8), \
+            (0,4,8), (2,4,6)]
+    return any(all((mask >> s) & 1 for s in win) for win in wins)
+
+def _child(x: int, o: int, x_to_move: bool, square: int) -> tuple[int, int, bool]:
+    if x_to_move:
+        return (x | (1 << square), o, False)
+    return (x, o | (1 << square), True)
+
+@lru_cache(maxsize=None)
+def _negamax(x: int, o: int, x_to_move: bool) -> int:
+    ''' exhaustive, unpruned score of a position for the player to move '''
+    if _lines(o if x_to_move else x):
+        return -1
+    if x | o == 0b111111111:
+        return 0
+    return max(-_negamax(*_child(x, o, x_to_move, s)) \
+               for s in range(9) if not ((x | o) >> s) & 1)
+
+def _reachablePositions() -> list[tuple[int, int, bool]]:
+    ''' all non-terminal positions reachable from an empty board, for both
+        starting players, in an order that mixes the two game trees
+    '''
+    positions = []
+    stack     = [(0, 0, True), (0, 0, False)]
+    seen      = set()
+    while stack:
+        x, o, x_to_move = position = stack.pop()
+        if position in seen:
+            continue
+        seen.add(position)
+        if _lines(x) or _lines(o) or x | o == 0b111111111:
+            continue
+        positions.append(position)
+        stack += [_child(x, o, x_to_move, s) \
+                  for s in range(9) if not ((x | o) >> s) & 1]
+    return positions
+
+def _wrongMoves() -> list[tuple[int, int, bool]]:
+    wrong = []
+    for x, o, x_to_move in _reachablePositions():
+        board = Board(x, o, Player.X if x_to_move else Player.O)
+        move  = TicTacToe.findBestMove(board)
+        if -_negamax(*_child(x, o, x_to_move, move)) != _negamax(x, o, x_to_move):
+            wrong.append((x, o, x_to_move))
+    return wrong
+
+######################################################################
+def test_findBestMove_is_optimal():
+    assert _wrongMoves() == []
+
+def test_search_is_optimal_for_both_starting_players():
+    # bypass the precomputed policy so every position is actually searched,
+    # sharing one transposition table across X-first and O-first games
+    saved = dict(BEST_MOVE)
+    BEST_MOVE.clear()
+    TicTacToe._TT.clear()
+    try:
+        assert _wrongMoves() == []
+    finally:
+        BEST_MOVE.update(saved)
+
+def test_parallel_search_matches_sequential():
+    boards = [Board(), Board(current_player=Player.O), \
+              Board().getNewBoardWithMove(0).getNewBoardWithMove(4)]
+    for board in boards:
+        TicTacToe._TT.clear()
+        sequential = TicTacToe.searchBestMove(board)
+        TicTacToe._TT.clear()
+        assert TicTacToe.searchBestMove(board, parallel=True, processes=2) \
+               == sequential
+
+def test_numba_search_is_optimal():
+    pytest.importorskip("numba")
+    for x, o, x_to_move in _reachablePositions():
+        board = Board(x, o, Player.X if x_to_move else Player.O)
+        move, result = TicTacToe.searchBestMove(board, use_numba=True)
+        assert result == _negamax(x, o, x_to_move)
+        assert -_negamax(*_child(x, o, x_to_move, move)) == result